@@ -1,23 +1,160 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from tkcalendar import DateEntry
-from PIL import Image, ImageTk
+import bisect
+import collections
+import concurrent.futures
 import datetime
 import csv
+import functools
+import hashlib
 import json
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.dates import DateFormatter
-import matplotlib.ticker as ticker
+import math
+import operator
 import os
+import re
 import sys
+import tempfile
+import threading
+import time
+import types
+
+# Canonical '%Y-%m-%d' dates as written by DataRepository
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Zoomed copies of pictures, reused across runs by ImageViewer
+_RESIZE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "clorieintake")
+_RESIZE_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Least recently used go first
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_pil():
+    """Import Pillow on first use; return a namespace holding Image and ImageTk.
+
+    Kept off module import so the main window can appear first; the
+    __main__ block warms it up on a background thread.
+    """
+    from PIL import Image, ImageTk
+
+    return types.SimpleNamespace(Image=Image, ImageTk=ImageTk)
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_thumb(path, mtime, size):
+    """Decode a picture into a thumbnail; safe to call from worker threads."""
+    pil = _lazy_pil()
+    image = pil.Image.open(path)
+    image.thumbnail(size)
+    return image
+
+
+# (path, mtime, size) -> PhotoImage, most recently used last; Tk thread only.
+# A plain dict so _load_thumbnail can check for a hit without decoding.
+_thumb_photos = collections.OrderedDict()
+_THUMB_CACHE_SIZE = 256
+
+
+def _cached_thumb(path, mtime, size):
+    """Return the thumbnail's PhotoImage if it has been built, else None."""
+    key = (path, mtime, size)
+    photo = _thumb_photos.get(key)
+    if photo is not None:
+        _thumb_photos.move_to_end(key)
+    return photo
+
+
+def _thumb(path, mtime, size):
+    """Return a cached thumbnail; `mtime` keys out pictures changed on disk."""
+    photo = _cached_thumb(path, mtime, size)
+    if photo is None:
+        pil = _lazy_pil()
+        photo = pil.ImageTk.PhotoImage(_decode_thumb(path, mtime, size))
+        _thumb_photos[path, mtime, size] = photo
+        if len(_thumb_photos) > _THUMB_CACHE_SIZE:
+            _thumb_photos.popitem(last=False)
+    return photo
+
+
+def _resize_lanczos(source, size, cache_path=None):
+    """LANCZOS-resize an image, reusing a copy saved at `cache_path` if any.
+
+    Safe to call from worker threads; the disk cache is best-effort.
+    """
+    pil = _lazy_pil()
+    if cache_path is not None:
+        try:
+            image = pil.Image.open(cache_path)
+            image.load()
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Truncated or corrupt; drop it so it is rewritten below
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+        else:
+            try:
+                os.utime(cache_path)  # Mark as recently used for pruning
+            except OSError:
+                pass
+            return image
+    image = source.resize(size, pil.Image.LANCZOS, reducing_gap=2.0)
+    if cache_path is not None:
+        try:
+            os.makedirs(_RESIZE_CACHE_DIR, exist_ok=True)
+            # A private temp file: both comparison viewers may write one frame
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=_RESIZE_CACHE_DIR)
+        except OSError:
+            return image
+        try:
+            with os.fdopen(fd, "wb") as file:
+                image.save(file, "PNG", compress_level=1)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    return image
+
+
+def _prune_resize_cache(max_bytes=_RESIZE_CACHE_MAX_BYTES):
+    """Delete the least recently used cached frames beyond `max_bytes`.
+
+    Safe to call from worker threads; errors are ignored.
+    """
+    try:
+        names = os.listdir(_RESIZE_CACHE_DIR)
+    except OSError:
+        return
+    files = []
+    for name in names:
+        path = os.path.join(_RESIZE_CACHE_DIR, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    files.sort(reverse=True)  # Most recently used first
+    total = 0
+    for _, size, path in files:
+        total += size
+        if total > max_bytes:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
 
 class DataEntry:
     """Class representing a single data entry."""
 
-    def __init__(self, date, weight, calories, picture_path=None):
+    def __init__(self, date, weight, calories, picture_path=None, date_obj=None):
         self.date = date  # Date string in '%Y-%m-%d' format
+        if date_obj is None:
+            date_obj = datetime.datetime.strptime(date, "%Y-%m-%d").date()
+        self.date_obj = date_obj  # Parsed copy of `date`, kept in sync on edit
         self.weight = weight
         self.calories = calories
         self.picture_path = picture_path
@@ -48,63 +185,83 @@ class DataRepository:
     def _load_from_csv(self):
         """Load data from CSV file."""
         data = []
-        with open(self.csv_file_path, "r", newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                date_str = self._parse_date(row["date"])
-                if date_str is None:
+        with open(self.csv_file_path, "r", newline="", buffering=1 << 20) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return data  # Empty file
+            getcols = operator.itemgetter(
+                *(header.index(name) for name in ("date", "weight", "calories"))
+            )
+            # Files written by older versions may lack the picture column, and
+            # rows may stop short of it; either way the entry has no picture
+            pic_i = header.index("picture_path") if "picture_path" in header else None
+            parse = self._parse_date
+            append = data.append
+            # filter(None, ...) skips blank lines
+            for row in filter(None, reader):
+                date, weight, calories = getcols(row)
+                date_obj = parse(date)
+                if date_obj is None:
                     continue  # Skip entries with invalid date formats
-                data.append(
+                picture_path = None
+                if pic_i is not None and len(row) > pic_i:
+                    picture_path = row[pic_i] or None
+                append(
                     DataEntry(
-                        date=date_str,
-                        weight=float(row["weight"]),
-                        calories=int(row["calories"]),
-                        picture_path=row.get("picture_path") or None,
+                        date=date_obj.strftime("%Y-%m-%d"),
+                        weight=float(weight),
+                        calories=int(calories),
+                        picture_path=picture_path,
+                        date_obj=date_obj,
                     )
                 )
         return data
 
     def _load_from_json(self):
         """Load data from JSON file."""
-        data = []
         with open(self.json_file_path, "r") as file:
             json_data = json.load(file)
-            for entry in json_data:
-                date_str = self._parse_date(entry["date"])
-                if date_str is None:
-                    continue  # Skip entries with invalid date formats
-                data.append(
-                    DataEntry(
-                        date=date_str,
-                        weight=entry["weight"],
-                        calories=entry["calories"],
-                        picture_path=entry.get("picture_path"),
-                    )
-                )
-        return data
+        parse = self._parse_date
+        parsed = ((parse(entry["date"]), entry) for entry in json_data)
+        return [
+            DataEntry(
+                date=date_obj.strftime("%Y-%m-%d"),
+                weight=entry["weight"],
+                calories=entry["calories"],
+                picture_path=entry.get("picture_path"),
+                date_obj=date_obj,
+            )
+            for date_obj, entry in parsed
+            if date_obj is not None  # Skip entries with invalid date formats
+        ]
 
     def _save_to_csv(self, data):
-        """Save data to CSV file."""
+        """Save data to CSV file, replacing it only once fully written."""
         fieldnames = ["date", "weight", "calories", "picture_path"]
-        with open(self.csv_file_path, "w", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for entry in data:
-                writer.writerow(
-                    {
-                        "date": entry.date,
-                        "weight": entry.weight,
-                        "calories": entry.calories,
-                        "picture_path": entry.picture_path or "",
-                    }
-                )
+        temp_path = self.csv_file_path + ".tmp"
+        with open(temp_path, "w", newline="", buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (entry.date, entry.weight, entry.calories, entry.picture_path or "")
+                for entry in data
+            )
+        os.replace(temp_path, self.csv_file_path)
 
     def _parse_date(self, date_str):
-        """Parse date string and convert to '%Y-%m-%d' format."""
+        """Parse date string into a date object, or None if no format matches."""
+        # Fast path for the canonical format; only the day range is left to check
+        if _ISO_DATE_RE.fullmatch(date_str):
+            try:
+                return datetime.date(
+                    int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10])
+                )
+            except ValueError:
+                pass
         for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
             try:
-                date_obj = datetime.datetime.strptime(date_str, fmt)
-                return date_obj.strftime("%Y-%m-%d")
+                return datetime.datetime.strptime(date_str, fmt).date()
             except ValueError:
                 continue
         messagebox.showwarning(
@@ -119,13 +276,31 @@ class WeightTrackerApp:
 
     def __init__(self, data_repository):
         self.data_repository = data_repository
-        self.data = self.data_repository.load_data()
+        # Entries are kept sorted by date. The `_dates`, `_weights` and
+        # `_calories` columns mirror it for bisecting and for the graph.
+        self.data = sorted(
+            self.data_repository.load_data(), key=lambda entry: entry.date_obj
+        )
+        self._dates = [entry.date_obj for entry in self.data]
+        self._weights = [entry.weight for entry in self.data]
+        self._calories = [entry.calories for entry in self.data]
+        self._by_date = {entry.date: entry for entry in self.data}
+        self._row_entries = {}  # Entries list rows, see display_entries
         self.picture_path = None
+        self._mpl = None  # matplotlib modules, imported by _matplotlib
+        self._graph_fig = None  # Reused by every graph window, see _graph_figure
+        self._graph_window = None
+
+        # Thumbnails are decoded off the Tk thread, see _load_thumbnail
+        self._thumb_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._pending_thumbs = []
+        self._picture_mtimes = {}  # See _picture_mtime
 
         self.root = tk.Tk()
         self.root.title("Weight Tracker")
         self.root.geometry("800x600")
         self.root.resizable(True, True)
+        self.root.bind("<Destroy>", self._stop_thumbnails, add="+")
 
         self.create_menu()
         self.create_input_frame()
@@ -133,6 +308,7 @@ class WeightTrackerApp:
         self.create_entries_frame()
 
         self.root.mainloop()
+        self._stop_thumbnails()  # File > Exit quits without destroying the root
 
     def create_menu(self):
         """Create the menu bar."""
@@ -237,6 +413,72 @@ class WeightTrackerApp:
         self.entries_frame = ttk.LabelFrame(self.root, text="Entries")
         self.entries_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
+        # Toolbar acting on the selected entry
+        toolbar = ttk.Frame(self.entries_frame)
+        toolbar.pack(fill="x", padx=5, pady=5)
+
+        edit_button = ttk.Button(
+            toolbar, text="⚙️ Edit", command=self.edit_selected_entry
+        )
+        edit_button.pack(side=tk.LEFT, padx=5)
+        CreateToolTip(edit_button, "Edit the selected entry.")
+
+        delete_button = ttk.Button(
+            toolbar, text="🗑️ Delete", command=self.delete_selected_entry
+        )
+        delete_button.pack(side=tk.LEFT, padx=5)
+        CreateToolTip(delete_button, "Delete the selected entry.")
+
+        view_picture_button = ttk.Button(
+            toolbar, text="View Picture", command=self.view_selected_picture
+        )
+        view_picture_button.pack(side=tk.LEFT, padx=5)
+        CreateToolTip(view_picture_button, "View the picture of the selected entry.")
+
+        # Entries list; thumbnails go in the tree column
+        style = ttk.Style(self.root)
+        style.configure("Entries.Treeview", rowheight=56)
+
+        list_frame = ttk.Frame(self.entries_frame)
+        list_frame.pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.entries_tree = ttk.Treeview(
+            list_frame,
+            columns=("date", "weight", "calories"),
+            selectmode="browse",
+            style="Entries.Treeview",
+        )
+        self.entries_tree.heading("#0", text="Picture")
+        self.entries_tree.heading("date", text="Date")
+        self.entries_tree.heading("weight", text="Weight")
+        self.entries_tree.heading("calories", text="Calories")
+        self.entries_tree.column("#0", width=70, stretch=False, anchor="center")
+        self.entries_tree.column("date", width=120)
+        self.entries_tree.column("weight", width=120)
+        self.entries_tree.column("calories", width=120)
+
+        scrollbar = ttk.Scrollbar(
+            list_frame, orient=tk.VERTICAL, command=self.entries_tree.yview
+        )
+        self.entries_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.entries_tree.pack(side=tk.LEFT, fill="both", expand=True)
+
+        self.entries_tree.bind("<Button-1>", self.on_entry_click)
+        self.entries_tree.bind("<Double-1>", self.on_entry_double_click)
+        self.entries_tree.bind("<Button-3>", self.show_entry_menu)
+
+        self.entry_menu = tk.Menu(self.root, tearoff=0)
+        self.entry_menu.add_command(label="Edit", command=self.edit_selected_entry)
+        self.entry_menu.add_command(label="Delete", command=self.delete_selected_entry)
+        self.entry_menu.add_command(
+            label="View Picture", command=self.view_selected_picture
+        )
+
+        self.no_entries_label = ttk.Label(
+            self.entries_frame, text="No entries to display."
+        )
+
         self.display_entries()
 
     def select_picture(self):
@@ -246,6 +488,7 @@ class WeightTrackerApp:
         )
         if file_path:
             self.picture_path = file_path
+            self._picture_mtimes.pop(file_path, None)
             messagebox.showinfo(
                 "Picture Selected", "Picture has been selected successfully."
             )
@@ -253,24 +496,24 @@ class WeightTrackerApp:
     def submit_entry(self):
         """Submit a new data entry or update an existing one."""
         try:
-            date = self.date_entry.get_date().strftime("%Y-%m-%d")
+            date_obj = self.date_entry.get_date()
+            date = date_obj.strftime("%Y-%m-%d")
             weight = float(self.weight_entry.get())
             calories = int(self.calories_entry.get())
 
-            new_entry = DataEntry(date, weight, calories, self.picture_path)
+            new_entry = DataEntry(
+                date, weight, calories, self.picture_path, date_obj=date_obj
+            )
 
             # Check if an entry with the same date exists
-            existing_entry = next(
-                (entry for entry in self.data if entry.date == date), None
-            )
+            existing_entry = self._by_date.get(date)
             if existing_entry:
                 # Replace existing entry
-                self.data[self.data.index(existing_entry)] = new_entry
+                self._remove_entry(existing_entry)
                 message = "Entry updated successfully!"
             else:
-                # Add new entry
-                self.data.append(new_entry)
                 message = "Entry added successfully!"
+            self._insert_entry(new_entry)
 
             self.data_repository.save_data(self.data)
 
@@ -291,66 +534,172 @@ class WeightTrackerApp:
 
     def display_entries(self):
         """Display data entries within the selected date range."""
-        for widget in self.entries_frame.winfo_children():
-            widget.destroy()
+        tree = self.entries_tree
+        tree.delete(*tree.get_children())
+        self.tree_images = []
+        # Tree-generated iid -> entry; dates are not unique in loaded data
+        self._row_entries = {}
 
         filtered_data = self.get_filtered_data()
 
         if not filtered_data:
-            ttk.Label(self.entries_frame, text="No entries to display.").pack(pady=10)
+            self.no_entries_label.pack(pady=10)
             return
-
-        # Sort entries by date, latest first
-        filtered_data.sort(
-            key=lambda x: datetime.datetime.strptime(x.date, "%Y-%m-%d"), reverse=True
-        )
-
-        for entry in filtered_data:
-            frame = ttk.Frame(self.entries_frame)
-            frame.pack(fill="x", pady=5)
-
-            date_label = ttk.Label(frame, text=entry.date, width=15)
-            date_label.pack(side=tk.LEFT, padx=5)
-
-            weight_label = ttk.Label(frame, text=f"{entry.weight} kg", width=15)
-            weight_label.pack(side=tk.LEFT, padx=5)
-
-            calories_label = ttk.Label(frame, text=f"{entry.calories} cal", width=15)
-            calories_label.pack(side=tk.LEFT, padx=5)
-
-            if entry.picture_path and os.path.exists(entry.picture_path):
-                image = Image.open(entry.picture_path)
-                image.thumbnail((50, 50))
-                photo = ImageTk.PhotoImage(image)
-                picture_label = ttk.Label(frame, image=photo)
-                picture_label.image = photo
-                picture_label.pack(side=tk.LEFT, padx=5)
-                picture_label.bind(
-                    "<Button-1>",
-                    lambda event, path=entry.picture_path: self.show_full_picture(
-                        path
+        self.no_entries_label.pack_forget()
+
+        # Latest first
+        for entry in reversed(filtered_data):
+            iid = tree.insert(
+                "",
+                "end",
+                values=(entry.date, f"{entry.weight} kg", f"{entry.calories} cal"),
+            )
+            self._row_entries[iid] = entry
+            if entry.picture_path and self._picture_exists(entry.picture_path):
+                self._load_thumbnail(
+                    entry.picture_path,
+                    (50, 50),
+                    functools.partial(
+                        self._set_row_thumbnail, iid, entry.picture_path
                     ),
                 )
-                CreateToolTip(picture_label, "Click to view full image.")
-
-            # Edit and Delete Icons
-            edit_button = ttk.Button(
-                frame,
-                text="⚙️",
-                command=lambda e=entry: self.edit_entry(e),
-                width=2,
-            )
-            edit_button.pack(side=tk.LEFT, padx=5)
-            CreateToolTip(edit_button, "Edit this entry.")
-
-            delete_button = ttk.Button(
-                frame,
-                text="🗑️",
-                command=lambda e=entry: self.delete_entry(e),
-                width=2,
-            )
-            delete_button.pack(side=tk.LEFT, padx=5)
-            CreateToolTip(delete_button, "Delete this entry.")
+
+    def _set_row_thumbnail(self, iid, path, photo):
+        """Show a loaded thumbnail on its row if the row still shows that picture."""
+        entry = self._row_entries.get(iid)
+        if entry is None or entry.picture_path != path:
+            return
+        if not self.entries_tree.exists(iid):
+            return
+        self.tree_images.append(photo)  # Keep a reference for Tk
+        self.entries_tree.item(iid, image=photo)
+
+    def _load_thumbnail(self, path, size, callback):
+        """Pass a thumbnail's PhotoImage to callback, decoding it in the background.
+
+        Cached thumbnails are passed at once, so redrawn rows keep their
+        pictures. Otherwise PIL decoding runs on the thread pool; the
+        PhotoImage is built and callback is run from the Tk thread by
+        _poll_thumbnails.
+        """
+        mtime = self._picture_mtime(path)
+        photo = _cached_thumb(path, mtime, size)
+        if photo is not None:
+            callback(photo)
+            return
+        future = self._thumb_pool.submit(_decode_thumb, path, mtime, size)
+        self._pending_thumbs.append((future, path, mtime, size, callback))
+        if len(self._pending_thumbs) == 1:
+            self.root.after(20, self._poll_thumbnails)
+
+    def _stop_thumbnails(self, event=None):
+        """Cancel queued thumbnail decodes and let the pool's threads exit.
+
+        The workers are joined at interpreter exit, so without this closing
+        the app would wait for every queued decode.
+        """
+        if event is not None and event.widget is not self.root:
+            return  # <Destroy> of a child widget, seen through the root's tag
+        # One by one: shutdown(cancel_futures=True) needs Python 3.9
+        for job in self._pending_thumbs:
+            job[0].cancel()
+        self._pending_thumbs = []
+        self._thumb_pool.shutdown(wait=False)
+
+    def _picture_mtime(self, path):
+        """Return a picture's mtime, or None if it is missing.
+
+        Results are memoized so refreshing the list does not stat every
+        picture again; entries are dropped when a picture is (re)selected
+        and the whole cache is cleared by the Update button.
+        """
+        try:
+            return self._picture_mtimes[path]
+        except KeyError:
+            pass
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        self._picture_mtimes[path] = mtime
+        return mtime
+
+    def _picture_exists(self, path):
+        """Return whether a picture exists, using the memoized stat."""
+        return self._picture_mtime(path) is not None
+
+    def _poll_thumbnails(self):
+        """Hand finished thumbnails to their callbacks."""
+        pending = []
+        for job in self._pending_thumbs:
+            future, path, mtime, size, callback = job
+            if not future.done():
+                pending.append(job)
+            elif future.exception() is None:
+                callback(_thumb(path, mtime, size))
+        self._pending_thumbs = pending
+        if pending:
+            self.root.after(20, self._poll_thumbnails)
+
+    def get_selected_entry(self):
+        """Return the entry selected in the entries list, if any."""
+        selection = self.entries_tree.selection()
+        if not selection:
+            messagebox.showinfo("No Selection", "Please select an entry first.")
+            return None
+        return self._row_entries.get(selection[0])
+
+    def edit_selected_entry(self):
+        """Edit the entry selected in the entries list."""
+        entry = self.get_selected_entry()
+        if entry:
+            self.edit_entry(entry)
+
+    def delete_selected_entry(self):
+        """Delete the entry selected in the entries list."""
+        entry = self.get_selected_entry()
+        if entry:
+            self.delete_entry(entry)
+
+    def view_selected_picture(self):
+        """Show the picture attached to the entry selected in the entries list."""
+        entry = self.get_selected_entry()
+        if not entry:
+            return
+        if not entry.picture_path:
+            messagebox.showinfo("No Picture", "This entry has no picture attached.")
+            return
+        self.show_full_picture(entry.picture_path)
+
+    def on_entry_click(self, event):
+        """Open the full picture when a row's thumbnail is clicked."""
+        tree = self.entries_tree
+        if tree.identify_region(event.x, event.y) != "tree":
+            return
+        entry = self._row_entries.get(tree.identify_row(event.y))
+        if entry and entry.picture_path and self._picture_exists(entry.picture_path):
+            self.show_full_picture(entry.picture_path)
+
+    def on_entry_double_click(self, event):
+        """Edit the entry whose row was double-clicked."""
+        tree = self.entries_tree
+        if tree.identify_region(event.x, event.y) != "cell":
+            return
+        entry = self._row_entries.get(tree.identify_row(event.y))
+        if entry:
+            self.edit_entry(entry)
+
+    def show_entry_menu(self, event):
+        """Select the row under the pointer and show the entry context menu."""
+        iid = self.entries_tree.identify_row(event.y)
+        if not iid:
+            return
+        self.entries_tree.selection_set(iid)
+        self.entries_tree.focus(iid)
+        try:
+            self.entry_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.entry_menu.grab_release()
 
     def get_filtered_data(self):
         """Get data filtered by the selected date range."""
@@ -366,13 +715,45 @@ class WeightTrackerApp:
             messagebox.showerror("Error", f"Invalid date selection: {e}")
             return []
 
-        filtered_data = []
-        for entry in self.data:
-            entry_date = datetime.datetime.strptime(entry.date, "%Y-%m-%d").date()
-            if start_date <= entry_date <= end_date:
-                filtered_data.append(entry)
-
-        return filtered_data
+        return self._date_range(start_date, end_date)
+
+    def _date_range(self, start_date, end_date):
+        """Return the entries dated from start_date to end_date inclusive."""
+        lo, hi = self._date_bounds(start_date, end_date)
+        return self.data[lo:hi]
+
+    def _date_bounds(self, start_date, end_date):
+        """Return the slice bounds of the entries in a date range."""
+        lo = bisect.bisect_left(self._dates, start_date)
+        hi = bisect.bisect_right(self._dates, end_date)
+        return lo, hi
+
+    def _insert_entry(self, entry):
+        """Insert an entry in date order and index it by date."""
+        index = bisect.bisect_right(self._dates, entry.date_obj)
+        self.data.insert(index, entry)
+        self._dates.insert(index, entry.date_obj)
+        self._weights.insert(index, entry.weight)
+        self._calories.insert(index, entry.calories)
+        self._by_date[entry.date] = entry
+
+    def _remove_entry(self, entry):
+        """Remove an entry from the sorted data and the date index."""
+        index = bisect.bisect_left(self._dates, entry.date_obj)
+        while self.data[index] is not entry:
+            index += 1  # Step over other entries loaded with the same date
+        del self.data[index]
+        del self._dates[index]
+        del self._weights[index]
+        del self._calories[index]
+        if self._by_date.get(entry.date) is entry:
+            # Re-index a remaining entry with the same date, if there is one
+            for neighbour in self.data[max(0, index - 1) : index + 1]:
+                if neighbour.date == entry.date:
+                    self._by_date[entry.date] = neighbour
+                    break
+            else:
+                del self._by_date[entry.date]
 
     def show_full_picture(self, path):
         """Display the full picture in a new window with comparison feature."""
@@ -439,20 +820,22 @@ class WeightTrackerApp:
 
         # Load Thumbnails with Date and Weight
         for entry in self.data:
-            if entry.picture_path and os.path.exists(entry.picture_path):
+            if entry.picture_path and self._picture_exists(entry.picture_path):
                 thumb_frame = ttk.Frame(inner_frame)
                 thumb_frame.pack(side=tk.LEFT, padx=5)
 
-                thumb_image = Image.open(entry.picture_path)
-                thumb_image.thumbnail((80, 80))
-                thumb_photo = ImageTk.PhotoImage(thumb_image)
-                thumb_label = ttk.Label(thumb_frame, image=thumb_photo)
-                thumb_label.image = thumb_photo
+                # Placeholder until the thumbnail has been decoded
+                thumb_label = ttk.Label(thumb_frame, text="Loading...")
                 thumb_label.pack()
+                self._load_thumbnail(
+                    entry.picture_path,
+                    (80, 80),
+                    functools.partial(self._set_label_image, thumb_label),
+                )
                 thumb_label.bind(
                     "<Button-1>",
-                    lambda event, path=entry.picture_path: right_viewer.load_image(
-                        path
+                    functools.partial(
+                        self._show_in_viewer, right_viewer, entry.picture_path
                     ),
                 )
 
@@ -466,12 +849,111 @@ class WeightTrackerApp:
                     thumb_label, f"Date: {entry.date}\nWeight: {entry.weight} kg"
                 )
 
+    def _show_in_viewer(self, viewer, path, event=None):
+        """Load a gallery picture into the comparison viewer."""
+        viewer.load_image(path)
+
+    def _set_label_image(self, label, photo):
+        """Show a loaded thumbnail on a label that may have been closed since."""
+        if label.winfo_exists():
+            label.configure(image=photo, text="")
+            label.image = photo
+
+    def _matplotlib(self):
+        """Import the matplotlib pieces used by the graph on first use."""
+        if self._mpl is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.dates import (
+                AutoDateLocator,
+                ConciseDateFormatter,
+                date2num,
+            )
+            from matplotlib.patches import Patch
+
+            self._mpl = types.SimpleNamespace(
+                Figure=Figure,
+                FigureCanvasTkAgg=FigureCanvasTkAgg,
+                AutoDateLocator=AutoDateLocator,
+                ConciseDateFormatter=ConciseDateFormatter,
+                date2num=date2num,
+                Patch=Patch,
+            )
+        return self._mpl
+
+    def _graph_figure(self):
+        """Return the graph figure, creating it and its artists on first use."""
+        if self._graph_fig is None:
+            mpl = self._matplotlib()
+
+            fig = mpl.Figure(figsize=(10, 6))
+            ax1 = fig.add_subplot()
+            ax2 = ax1.twinx()
+
+            # Artists are created once and updated in place by _set_graph_data
+            (weight_line,) = ax1.plot(
+                [], [], color="blue", marker="o", label="Weight"
+            )
+            ax1.set_xlabel("Date")
+            ax1.set_ylabel("Weight (kg)", color="blue")
+            ax1.tick_params(axis="y", labelcolor="blue")
+            ax1.grid(True)
+
+            # Date ticks are configured once; they follow the limits on redraw
+            date_locator = mpl.AutoDateLocator()
+            ax1.xaxis.set_major_locator(date_locator)
+            ax1.xaxis.set_major_formatter(mpl.ConciseDateFormatter(date_locator))
+            ax1.tick_params(axis="x", labelrotation=45)
+
+            ax2.set_ylabel("Calories", color="red")
+            ax2.tick_params(axis="y", labelcolor="red")
+
+            calorie_patch = mpl.Patch(color="red", alpha=0.3, label="Calories")
+            fig.legend(
+                handles=[weight_line, calorie_patch],
+                loc="upper right",
+                bbox_to_anchor=(1, 1),
+                bbox_transform=ax1.transAxes,
+            )
+
+            self._graph_fig = fig
+            self._graph_ax1 = ax1
+            self._graph_ax2 = ax2
+            self._weight_line = weight_line
+            self._calorie_bars = None
+        return self._graph_fig
+
+    def _set_graph_data(self, dates, weights, calories):
+        """Replace the data shown by the graph figure."""
+        self._graph_figure()
+        self._weight_line.set_data(dates, weights)
+        if self._calorie_bars is not None:
+            self._calorie_bars.remove()
+            self._calorie_bars = None
+        if len(dates):
+            self._calorie_bars = self._graph_ax2.bar(
+                dates, calories, color="red", alpha=0.3, width=0.8
+            )
+        for ax in (self._graph_ax1, self._graph_ax2):
+            ax.relim()
+            ax.autoscale_view()
+
     def show_graph(self):
         """Display a consolidated graph of weight and calorie intake."""
+        if self._graph_window is not None:
+            # The figure can only be shown in one window at a time
+            self._graph_window.deiconify()
+            self._graph_window.lift()
+            return
+
+        mpl = self._matplotlib()
+        fig = self._graph_figure()
+
         window = tk.Toplevel(self.root)
         window.title("Weight and Calorie Graph")
         window.geometry("900x600")
         window.resizable(True, True)
+        self._graph_window = window
 
         # Date Range Selector in Graph Window
         date_range_frame = ttk.Frame(window)
@@ -511,11 +993,14 @@ class WeightTrackerApp:
         download_pdf_button.grid(row=0, column=5, padx=5, pady=5, sticky="w")
         CreateToolTip(download_pdf_button, "Download the graph as a PDF file.")
 
-        # Figure and Canvas Setup
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        canvas = FigureCanvasTkAgg(fig, master=window)
+        # Canvas Setup; the cached figure is attached to this window's canvas
+        canvas = mpl.FigureCanvasTkAgg(fig, master=window)
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        def clear_graph():
+            self._set_graph_data([], [], [])
+            canvas.draw_idle()
+
         def update_graph():
             try:
                 start_date = graph_start_date_entry.get_date()
@@ -524,66 +1009,39 @@ class WeightTrackerApp:
                     messagebox.showerror(
                         "Invalid Date Range", "Start date cannot be after end date."
                     )
-                    ax1.clear()
-                    canvas.draw()
+                    clear_graph()
                     return
             except Exception as e:
                 messagebox.showerror("Error", f"Invalid date selection: {e}")
-                ax1.clear()
-                canvas.draw()
+                clear_graph()
                 return
 
-            filtered_data = [
-                entry
-                for entry in self.data
-                if start_date
-                <= datetime.datetime.strptime(entry.date, "%Y-%m-%d").date()
-                <= end_date
-            ]
+            lo, hi = self._date_bounds(start_date, end_date)
 
-            if not filtered_data:
+            if lo == hi:
                 messagebox.showinfo(
                     "No Data", "No data available for the selected date range."
                 )
-                ax1.clear()
-                canvas.draw()
+                clear_graph()
                 return
 
-            dates = [
-                datetime.datetime.strptime(entry.date, "%Y-%m-%d")
-                for entry in filtered_data
-            ]
-            weights = [entry.weight for entry in filtered_data]
-            calories = [entry.calories for entry in filtered_data]
-
-            # Sort data by date
-            dates, weights, calories = zip(*sorted(zip(dates, weights, calories)))
+            # Dates go in as matplotlib date numbers since set_data skips
+            # the unit conversion that plot() would do
+            dates = mpl.date2num(self._dates[lo:hi])
+            weights = self._weights[lo:hi]
+            calories = self._calories[lo:hi]
+            self._set_graph_data(dates, weights, calories)
 
-            ax1.clear()
-            ax1.plot(dates, weights, color="blue", marker="o", label="Weight")
-            ax1.set_xlabel("Date")
-            ax1.set_ylabel("Weight (kg)", color="blue")
-            ax1.tick_params(axis="y", labelcolor="blue")
-            ax1.grid(True)
-
-            ax2 = ax1.twinx()
-            ax2.bar(dates, calories, color="red", alpha=0.3, width=0.8, label="Calories")
-            ax2.set_ylabel("Calories", color="red")
-            ax2.tick_params(axis="y", labelcolor="red")
-
-            # Adjust x-axis date formatting
-            fig.autofmt_xdate(rotation=45)
-            ax1.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
-            ax1.xaxis.set_major_formatter(DateFormatter("%Y-%m-%d"))
-
-            fig.legend(loc="upper right", bbox_to_anchor=(1, 1), bbox_transform=ax1.transAxes)
             fig.tight_layout(rect=[0, 0, 1, 0.95])
 
-            canvas.draw()
+            # Coalesces with the resize redraw when the window first opens
+            canvas.draw_idle()
 
         def on_close():
-            plt.close(fig)
+            # Keep the figure for the next graph window
+            canvas.get_tk_widget().destroy()
             window.destroy()
+            self._graph_window = None
 
         window.protocol("WM_DELETE_WINDOW", on_close)
 
@@ -606,6 +1064,7 @@ class WeightTrackerApp:
 
     def update_display(self):
         """Update the entries when date range changes."""
+        self._picture_mtimes.clear()  # Pick up pictures changed on disk
         self.display_entries()
 
     def edit_entry(self, entry):
@@ -616,7 +1075,7 @@ class WeightTrackerApp:
 
         ttk.Label(edit_window, text="Date:").grid(row=0, column=0, padx=5, pady=5)
         date_entry = DateEntry(edit_window, date_pattern="yyyy-mm-dd")
-        date_entry.set_date(datetime.datetime.strptime(entry.date, "%Y-%m-%d"))
+        date_entry.set_date(entry.date_obj)
         date_entry.grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Label(edit_window, text="Weight (kg):").grid(
@@ -636,15 +1095,15 @@ class WeightTrackerApp:
         picture_frame = ttk.Frame(edit_window)
         picture_frame.grid(row=3, column=0, columnspan=2, padx=5, pady=5)
 
-        if entry.picture_path and os.path.exists(entry.picture_path):
-            image = Image.open(entry.picture_path)
-            image.thumbnail((100, 100))
-            photo = ImageTk.PhotoImage(image)
+        if entry.picture_path and self._picture_exists(entry.picture_path):
+            mtime = self._picture_mtime(entry.picture_path)
+            photo = _thumb(entry.picture_path, mtime, (100, 100))
             picture_label = ttk.Label(picture_frame, image=photo)
             picture_label.image = photo
             picture_label.pack()
 
             def remove_picture():
+                self._picture_mtimes.pop(entry.picture_path, None)
                 entry.picture_path = None
                 picture_label.destroy()
                 remove_button.destroy()
@@ -662,6 +1121,7 @@ class WeightTrackerApp:
             )
             if file_path:
                 entry.picture_path = file_path
+                self._picture_mtimes.pop(file_path, None)
                 messagebox.showinfo(
                     "Picture Selected", "Picture has been selected successfully."
                 )
@@ -673,23 +1133,25 @@ class WeightTrackerApp:
 
         def save_changes():
             try:
-                new_date = date_entry.get_date().strftime("%Y-%m-%d")
+                new_date_obj = date_entry.get_date()
+                new_date = new_date_obj.strftime("%Y-%m-%d")
                 new_weight = float(weight_entry.get())
                 new_calories = int(calories_entry.get())
 
                 # Check if date has changed and conflicts with existing entries
-                if new_date != entry.date and any(
-                    e.date == new_date for e in self.data if e != entry
-                ):
+                if new_date != entry.date and new_date in self._by_date:
                     messagebox.showerror(
                         "Date Conflict", "An entry with this date already exists."
                     )
                     return
 
-                # Update entry
+                # Update entry, re-filing it under its (possibly new) date
+                self._remove_entry(entry)
                 entry.date = new_date
+                entry.date_obj = new_date_obj
                 entry.weight = new_weight
                 entry.calories = new_calories
+                self._insert_entry(entry)
 
                 self.data_repository.save_data(self.data)
                 messagebox.showinfo("Success", "Entry updated successfully.")
@@ -716,7 +1178,7 @@ class WeightTrackerApp:
             "Confirm Deletion", "Are you sure you want to delete this entry?"
         )
         if response:
-            self.data.remove(entry)
+            self._remove_entry(entry)
             self.data_repository.save_data(self.data)
             messagebox.showinfo("Success", "Entry deleted successfully.")
             self.display_entries()
@@ -734,6 +1196,7 @@ class ImageViewer(tk.Canvas):
     """Canvas widget for displaying images with zoom and pan functionality."""
 
     def __init__(self, parent, image_path=None):
+        pil = _lazy_pil()
         super().__init__(parent, background="black", highlightthickness=0)
         self.parent = parent
         self.bind("<ButtonPress-1>", self.move_start)
@@ -741,8 +1204,32 @@ class ImageViewer(tk.Canvas):
         self.bind("<MouseWheel>", self.zoom)
         self.bind("<Button-4>", self.zoom)  # For Linux with wheel up
         self.bind("<Button-5>", self.zoom)  # For Linux with wheel down
+        self.bind("<Destroy>", self.on_destroy)
+        self.bind("<Configure>", self.on_resize)
         self.image = None
+        self._cache_stamp = None  # (path, mtime) keying the disk cache
+        self._pyramid = []
         self.tk_image = None
+        self._img_id = None  # The canvas image item, reused by every redraw
+        self._viewport = False  # Whether the item shows only the visible part
+        # Uncached frames are pasted into one PhotoImage while the size holds
+        self._scratch = None
+        self._scratch_key = None
+        # Recently shown zoom levels: (width, height) -> PhotoImage
+        self._resize_cache = collections.OrderedDict()
+        self._resize_cache_size = 8
+        # Zooming resamples with a fast filter; LANCZOS follows once it settles
+        self._quality = pil.Image.BILINEAR
+        self.hq_delay = 150  # milliseconds
+        self._hq_id = None
+        # LANCZOS runs off the Tk thread; frames superseded meanwhile are dropped
+        self._hq_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._hq_job = None
+        self._hq_generation = 0
+        self._hq_poll_id = None
+        # Redraws requested within one event-loop pass share one idle callback
+        self._redraw_id = None
+        self._redraw_interactive = True
         self.scale = 1.0
         self.translate_x = 0
         self.translate_y = 0
@@ -751,8 +1238,41 @@ class ImageViewer(tk.Canvas):
 
     def load_image(self, image_path):
         """Load and display the image."""
-        pil_image = Image.open(image_path)
+        pil = _lazy_pil()
+        pil_image = pil.Image.open(image_path)
+        try:
+            stat = os.stat(image_path)
+            self._cache_stamp = (os.path.abspath(image_path), stat.st_mtime_ns)
+        except OSError:
+            self._cache_stamp = None  # Not a file on disk; skip the disk cache
+        else:
+            self._hq_pool.submit(_prune_resize_cache)  # Keep the cache bounded
+        # Let the JPEG decoder scale down by a power of two while decoding;
+        # the canvas never shows more than a screenful of pixels at once.
+        # Other formats ignore this.
+        pil_image.draft(None, (self.winfo_screenwidth(), self.winfo_screenheight()))
+        pil_image.load()  # Decode once, after draft() has taken effect
+        # Resampling has fast paths for these modes; palette, 1-bit, CMYK and
+        # the like would otherwise be converted again on every resize.
+        if pil_image.mode not in ("RGB", "RGBA", "L"):
+            pil_image = pil_image.convert("RGBA")
         self.image = pil_image
+        # Successively halved copies, so zoomed-out redraws resample a small image
+        self._pyramid = [pil_image]
+        while min(self._pyramid[-1].size) >= 64:
+            self._pyramid.append(self._pyramid[-1].reduce(2))
+        # Drop any LANCZOS pass for the previous picture now; its poll may
+        # fire before the redraw below bumps the generation
+        self._hq_generation += 1
+        self.unschedule_hq()
+        if self._hq_poll_id:
+            self.after_cancel(self._hq_poll_id)
+            self._hq_poll_id = None
+        if self._hq_job is not None:
+            self._hq_job[0].cancel()
+            self._hq_job = None
+        self._resize_cache.clear()
+        self._scratch = None
         self.scale = 1.0
         self.translate_x = 0
         self.translate_y = 0
@@ -765,6 +1285,8 @@ class ImageViewer(tk.Canvas):
     def move_move(self, event):
         """Drag (move) canvas to the new position."""
         self.scan_dragto(event.x, event.y, gain=1)
+        if self._viewport:
+            self.redraw(interactive=True)  # Fill in the newly uncovered area
 
     def zoom(self, event):
         """Zoom in/out with mouse wheel."""
@@ -777,78 +1299,339 @@ class ImageViewer(tk.Canvas):
             factor = 1.0
 
         self.scale *= factor
+        self.redraw(interactive=True)
+
+    def on_resize(self, _=None):
+        """Re-render a frame that covers only the previously visible area."""
+        if self._viewport:
+            self.redraw(interactive=True)
+
+    def on_destroy(self, _=None):
+        """Drop any pending redraws of a closed viewer."""
+        self.unschedule_hq()
+        for _id in (self._redraw_id, self._hq_poll_id):
+            if _id:
+                self.after_cancel(_id)
+        self._redraw_id = self._hq_poll_id = None
+        self._hq_pool.shutdown(wait=False)
+
+    def schedule_hq(self):
+        """(Re)start the countdown to the high-quality redraw."""
+        self.unschedule_hq()
+        self._hq_id = self.after(self.hq_delay, self.render_hq)
+
+    def unschedule_hq(self):
+        _id = self._hq_id
+        self._hq_id = None
+        if _id:
+            self.after_cancel(_id)
+
+    def render_hq(self):
+        """Replace the interactive preview with a LANCZOS-resampled image."""
+        self._hq_id = None
         self.redraw()
 
-    def redraw(self):
-        """Redraw the image on the canvas."""
-        self.delete("all")
+    def redraw(self, interactive=False):
+        """Schedule a redraw of the image once pending events are handled.
+
+        The frame is interactive only if every coalesced request was.
+        """
+        self._redraw_interactive = self._redraw_interactive and interactive
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self._do_redraw)
+
+    def _visible_box(self, scaled_width, scaled_height):
+        """Return the part of the scaled image in view, or None if it all fits.
+
+        The box is (left, top, right, bottom) in scaled-image pixels.
+        """
+        view_width, view_height = self.winfo_width(), self.winfo_height()
+        if view_width <= 1 or view_height <= 1:
+            return None  # Not mapped yet
+        if scaled_width <= view_width and scaled_height <= view_height:
+            return None
+        left = min(max(0, int(self.canvasx(0)) - self.translate_x), scaled_width - 1)
+        top = min(max(0, int(self.canvasy(0)) - self.translate_y), scaled_height - 1)
+        right = min(scaled_width, left + view_width)
+        bottom = min(scaled_height, top + view_height)
+        return left, top, right, bottom
+
+    def _scratch_photo(self, image):
+        """Return a PhotoImage showing image, reusing the previous one if it fits."""
+        pil = _lazy_pil()
+        key = (image.mode, image.size)
+        if self._scratch is None or self._scratch_key != key:
+            # The previous Tk image is deleted as soon as tk_image moves on
+            self._scratch = pil.ImageTk.PhotoImage(image)
+            self._scratch_key = key
+        else:
+            self._scratch.paste(image)
+        return self._scratch
+
+    def _do_redraw(self):
+        """Redraw the image on the canvas.
+
+        Interactive redraws resample with a fast filter and leave the
+        LANCZOS pass to render_hq, which runs it on the worker thread;
+        only whole-image LANCZOS results are cached. When zoomed in past
+        the canvas, only the visible part of the image is resampled.
+        """
+        pil = _lazy_pil()
+        interactive = self._redraw_interactive
+        self._redraw_id = None
+        self._redraw_interactive = True
+        self._hq_generation += 1  # Supersedes any LANCZOS pass still running
+        if self.image is None:
+            return  # Nothing loaded yet, e.g. the empty side of a comparison
         width, height = self.image.size
-        scaled_width = int(width * self.scale)
-        scaled_height = int(height * self.scale)
-        resized_image = self.image.resize((scaled_width, scaled_height), Image.LANCZOS)
-        self.tk_image = ImageTk.PhotoImage(resized_image)
-        self.create_image(self.translate_x, self.translate_y, anchor="nw", image=self.tk_image)
-        self.configure(scrollregion=self.bbox("all"))
+        scaled_width = max(1, int(width * self.scale))
+        scaled_height = max(1, int(height * self.scale))
+        # The image is the only item, so its extent is known without bbox("all").
+        # Set first: panning and the visible box below are confined to it.
+        self.configure(
+            scrollregion=(
+                self.translate_x,
+                self.translate_y,
+                self.translate_x + scaled_width,
+                self.translate_y + scaled_height,
+            )
+        )
+        x, y = self.translate_x, self.translate_y
+        key = (scaled_width, scaled_height)
+        tk_image = self._resize_cache.get(key)
+        if tk_image is not None:
+            self._resize_cache.move_to_end(key)
+            self.unschedule_hq()  # Already showing the LANCZOS result
+            self._viewport = False
+            self._show(tk_image, x, y)
+            return
+        # Smallest pyramid level that is still at least the target size.
+        # Past the last level, reducing_gap box-reduces the remainder first.
+        level = max(0, int(-math.log2(self.scale)))
+        source = self._pyramid[min(level, len(self._pyramid) - 1)]
+        # Within a pixel of 1:1, e.g. right after loading, show pixels as they
+        # are. The whole image is shown, even if the canvas shows only part of
+        # it, so panning and resizing the viewer need no re-render.
+        if abs(scaled_width - width) <= 1 and abs(scaled_height - height) <= 1:
+            tk_image = pil.ImageTk.PhotoImage(self.image)
+            self._resize_cache[key] = tk_image
+            if len(self._resize_cache) > self._resize_cache_size:
+                self._resize_cache.popitem(last=False)
+            self.unschedule_hq()  # Nothing better to wait for
+            self._viewport = False
+            self._show(tk_image, x, y)
+            return
+        box = self._visible_box(scaled_width, scaled_height)
+        if box is not None:
+            left, top, right, bottom = box
+            x_step = source.width / scaled_width
+            y_step = source.height / scaled_height
+            x += left
+            y += top
+            if not interactive:
+                # Resample just the source region that ends up on screen
+                self._submit_hq(
+                    None,
+                    x,
+                    y,
+                    source.resize,
+                    (right - left, bottom - top),
+                    pil.Image.LANCZOS,
+                    box=(left * x_step, top * y_step, right * x_step, bottom * y_step),
+                    reducing_gap=2.0,
+                )
+                return
+            else:
+                # Map viewport pixels straight to source pixels in one pass
+                resized_image = source.transform(
+                    (right - left, bottom - top),
+                    pil.Image.AFFINE,
+                    (x_step, 0, left * x_step, 0, y_step, top * y_step),
+                    self._quality,
+                )
+        elif interactive:
+            if scaled_width % width == 0 and scaled_height % height == 0:
+                # Whole-number zoom: plain pixel repetition, no filtering
+                resized_image = self.image.resize(key, pil.Image.NEAREST)
+            else:
+                resized_image = source.resize(key, self._quality, reducing_gap=2.0)
+        else:
+            self._submit_hq(
+                key, x, y, _resize_lanczos, source, key, self._disk_cache_path(key)
+            )
+            return
+        self.schedule_hq()
+        self._viewport = box is not None
+        self._show(self._scratch_photo(resized_image), x, y)
+
+    def _disk_cache_path(self, size):
+        """Return where the picture resized to `size` is cached on disk, or None."""
+        if self._cache_stamp is None:
+            return None
+        digest = hashlib.sha1(repr((*self._cache_stamp, size)).encode()).hexdigest()
+        return os.path.join(_RESIZE_CACHE_DIR, digest + ".png")
+
+    def _submit_hq(self, cache_key, x, y, fn, *args, **kwargs):
+        """Run a resample on the worker thread; _poll_hq shows it at (x, y).
+
+        Whole-image results pass their size as cache_key, visible-area
+        results pass None.
+        """
+        if self._hq_job is not None:
+            self._hq_job[0].cancel()  # Only drops it if it has not started
+        future = self._hq_pool.submit(fn, *args, **kwargs)
+        self._hq_job = (future, self._hq_generation, cache_key, x, y)
+        if self._hq_poll_id is None:
+            self._hq_poll_id = self.after(20, self._poll_hq)
+
+    def _poll_hq(self):
+        """Show the finished LANCZOS frame unless a newer frame was drawn."""
+        pil = _lazy_pil()
+        self._hq_poll_id = None
+        future, generation, cache_key, x, y = self._hq_job
+        if not future.done():
+            self._hq_poll_id = self.after(20, self._poll_hq)
+            return
+        self._hq_job = None
+        if generation != self._hq_generation or future.exception() is not None:
+            return
+        if cache_key is None:
+            tk_image = self._scratch_photo(future.result())
+        else:
+            tk_image = pil.ImageTk.PhotoImage(future.result())
+            self._resize_cache[cache_key] = tk_image
+            if len(self._resize_cache) > self._resize_cache_size:
+                self._resize_cache.popitem(last=False)
+        self._viewport = cache_key is None
+        self._show(tk_image, x, y)
+
+    def _show(self, tk_image, x, y):
+        """Display tk_image with its top-left corner at canvas (x, y)."""
+        self.tk_image = tk_image  # Keep a reference for Tk
+        if self._img_id is None:
+            self._img_id = self.create_image(x, y, anchor="nw", image=self.tk_image)
+        else:
+            self.itemconfigure(self._img_id, image=self.tk_image)
+            self.coords(self._img_id, x, y)
 
 
 class CreateToolTip:
     """Create a tooltip for a given widget."""
 
+    _style_configured = False  # "Tooltip.TLabel" is shared by all tooltips
+    _last_leave_ts = 0.0  # time.monotonic() when any tooltip's widget was left
+    # Toplevel path -> count of <Configure> events in it, see _watch_toplevel
+    _layout_generation = {}
+
     def __init__(self, widget, text="widget info"):
-        self.waittime = 500  # milliseconds
+        self.waittime = 500  # milliseconds, adjusted on each enter()
         self.wraplength = 180  # pixels
         self.widget = widget
         self.text = text
+        # Bound once; schedule/unschedule run on every pointer crossing
+        self._after = widget.after
+        self._cancel = widget.after_cancel
         self.widget.bind("<Enter>", self.enter)
         self.widget.bind("<Leave>", self.leave)
+        self._toplevel = self._watch_toplevel(widget.winfo_toplevel())
         self.id = None
-        self.top = None
+        self.top = None  # Built on first show, then withdrawn and reused
+        self.label = None
+        self._root_xy = None  # Cached (x, y) for the tip, None until shown
+        self._root_xy_generation = None  # Layout generation _root_xy is from
+
+    @classmethod
+    def _watch_toplevel(cls, toplevel):
+        """Count <Configure> events in a toplevel; return its registry key.
+
+        One handler per toplevel covers every tooltip in it. The toplevel
+        is in the bindtags of all its descendants, so moving the window and
+        re-laying-out any widget in it both bump the count.
+        """
+        key = str(toplevel)
+        if key not in cls._layout_generation:
+            cls._layout_generation[key] = 0
+
+            def on_configure(_):
+                if key in cls._layout_generation:  # Not yet torn down
+                    cls._layout_generation[key] += 1
+
+            def on_destroy(event):
+                if event.widget is toplevel:
+                    cls._layout_generation.pop(key, None)
+
+            toplevel.bind("<Configure>", on_configure, add="+")
+            toplevel.bind("<Destroy>", on_destroy, add="+")
+        return key
 
     def enter(self, _=None):
+        # Show promptly after a pause, but hold back while the pointer is
+        # sweeping across widgets so passing over them does not pop tips up
+        idle = time.monotonic() - CreateToolTip._last_leave_ts
+        self.waittime = 200 if idle > 2 else 700
         self.schedule()
 
     def leave(self, _=None):
+        CreateToolTip._last_leave_ts = time.monotonic()
         self.unschedule()
         self.hidetip()
 
     def schedule(self):
         self.unschedule()
-        self.id = self.widget.after(self.waittime, self.showtip)
+        self.id = self._after(self.waittime, self.showtip)
 
     def unschedule(self):
         _id = self.id
         self.id = None
         if _id:
-            self.widget.after_cancel(_id)
+            self._cancel(_id)
 
     def showtip(self, _=None):
-        x = y = 0
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
-        self.top = tk.Toplevel(self.widget)
-        self.top.wm_overrideredirect(True)
+        generation = CreateToolTip._layout_generation.get(self._toplevel)
+        if self._root_xy is None or self._root_xy_generation != generation:
+            self._root_xy_generation = generation
+            try:
+                # None when the insert cursor of a text widget is out of view
+                bbox = self.widget.bbox("insert") or (0, 0)
+            except tk.TclError:
+                bbox = (0, 0)  # No insert cursor at all, e.g. buttons
+            self._root_xy = (
+                bbox[0] + self.widget.winfo_rootx() + 25,
+                bbox[1] + self.widget.winfo_rooty() + 20,
+            )
+        x, y = self._root_xy
+        if self.top is None:
+            if not CreateToolTip._style_configured:
+                # Configured on first use rather than at import, since a
+                # ttk.Style needs the application's Tk root to exist
+                ttk.Style(self.widget).configure(
+                    "Tooltip.TLabel",
+                    justify="left",
+                    background="#ffffe0",
+                    relief="solid",
+                    borderwidth=1,
+                )
+                CreateToolTip._style_configured = True
+            self.top = tk.Toplevel(self.widget)
+            self.top.wm_withdraw()
+            self.top.wm_overrideredirect(True)
+            self.label = ttk.Label(
+                self.top, style="Tooltip.TLabel", wraplength=self.wraplength
+            )
+            self.label.pack(ipadx=1)
+        self.label.configure(text=self.text)
         self.top.wm_geometry(f"+{x}+{y}")
-        label = ttk.Label(
-            self.top,
-            text=self.text,
-            justify="left",
-            background="#ffffe0",
-            relief="solid",
-            borderwidth=1,
-            wraplength=self.wraplength,
-        )
-        label.pack(ipadx=1)
+        self.top.deiconify()
 
     def hidetip(self):
-        top = self.top
-        self.top = None
-        if top:
-            top.destroy()
+        if self.top:
+            self.top.wm_withdraw()
 
 
 if __name__ == "__main__":
     csv_file = "weight_data.csv"
     json_file = "weight_data.json"
     data_repository = DataRepository(csv_file, json_file)
+    # Import Pillow while the main window is being built
+    threading.Thread(target=_lazy_pil, daemon=True).start()
     WeightTrackerApp(data_repository)